@@ -375,6 +375,18 @@ def handle_array_function(fn):
     return _handle_array_function
 
 
+def _is_array_like_parameter(annotation, parameter):
+    annotation_str = str(annotation)
+    return (
+        ("rray" in annotation_str or "Tensor" in annotation_str)
+        and parameter != "out"
+        and all(
+            sq not in annotation_str
+            for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+        )
+    )
+
+
 def handle_array_like_without_promotion(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def _handle_array_like_without_promotion(*args, **kwargs):
@@ -392,15 +404,7 @@ def handle_array_like_without_promotion(fn: Callable) -> Callable:
         for i, (annotation, parameter, arg) in enumerate(
             zip(annotations, parameters, args)
         ):
-            annotation_str = str(annotation)
-            if (
-                ("rray" in annotation_str or "Tensor" in annotation_str)
-                and parameter != "out"
-                and all(
-                    sq not in annotation_str
-                    for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
-                )
-            ):
+            if _is_array_like_parameter(annotation, parameter):
                 if i < num_args:
                     # Fix for ellipsis, slices for numpy's __getitem__
                     # No need to try and convert them into arrays
@@ -1067,6 +1071,121 @@ def temp_asarray_wrapper(fn: Callable) -> Callable:
     return _temp_asarray_wrapper
 
 
+# Fast Path Handling #
+# -------------------#
+
+# decorators whose work is a no-op for plain array arguments, so that functions
+# wrapped with nothing else can skip the decorator chain for such arguments
+_FAST_PATH_DECORATORS = {
+    "handle_exceptions",
+    "handle_backend_invalid",
+    "handle_nestable",
+    "handle_ragged",
+    "handle_out_argument",
+    "inputs_to_native_arrays",
+    "outputs_to_ivy_arrays",
+    "handle_array_function",
+    "handle_device",
+    "handle_array_like_without_promotion",
+    "handle_nans",
+}
+
+_fast_path_leaf_types = (int, float, bool, complex, str, type(None))
+_no_fast_path = object()
+
+
+def _supports_fast_path(original, to_wrap):
+    decorators = {attr for attr in FN_DECORATORS if hasattr(original, attr)}
+    return (
+        not hasattr(original, "mixed_backend_wrappers")
+        and not any(hasattr(to_wrap, attr) for attr in FN_DECORATORS)
+        and decorators.issubset(_FAST_PATH_DECORATORS)
+        and {"inputs_to_native_arrays", "outputs_to_ivy_arrays"}.issubset(decorators)
+    )
+
+
+def _array_like_positions(fn):
+    try:
+        parameters = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return None
+    return tuple(
+        i
+        for i, (name, param) in enumerate(parameters.items())
+        if _is_array_like_parameter(param.annotation, name)
+    )
+
+
+def _to_native_fast_path(x, backend):
+    """
+    Return the native form of the argument `x`, or `_no_fast_path` if it is anything
+    other than an array or a plain python value.
+    """
+    cls = type(x)
+    if cls is ivy.Array:
+        return x._data if x._backend == backend else _no_fast_path
+    if cls in _fast_path_leaf_types or isinstance(x, (ivy.NativeArray, ivy.Dtype)):
+        return x
+    if cls is tuple and all(type(i) is int for i in x):
+        return x
+    return _no_fast_path
+
+
+def handle_fast_path(backend_fn: Callable, array_like_positions=()) -> Callable:
+    """
+    Wrap the fully decorated function `fn` so that calls with only native arrays,
+    ivy.Array instances and plain python values go straight to `backend_fn`.
+
+    The arguments are inspected once, and `fn` is called instead whenever they
+    include containers, nests, other backends' arrays or an `out` argument, or when
+    a global mode (array mode, nan policy, soft device mode) requires the full chain.
+    """
+
+    def _handle_fast_path(fn):
+        @functools.wraps(fn)
+        def _fast_path(*args, **kwargs):
+            if (
+                not ivy.array_mode
+                or ivy.soft_device_mode
+                or ivy.nan_policy != "nothing"
+                or kwargs.get("out", None) is not None
+            ):
+                return fn(*args, **kwargs)
+            backend = ivy.backend
+            native_args = []
+            for arg in args:
+                arg = _to_native_fast_path(arg, backend)
+                if arg is _no_fast_path:
+                    return fn(*args, **kwargs)
+                native_args.append(arg)
+            for i in array_like_positions:
+                if i < len(native_args) and not isinstance(
+                    native_args[i], ivy.NativeArray
+                ):
+                    return fn(*args, **kwargs)
+            native_kwargs = {}
+            for key, value in kwargs.items():
+                if key == "out":
+                    continue
+                value = _to_native_fast_path(value, backend)
+                if value is _no_fast_path:
+                    return fn(*args, **kwargs)
+                native_kwargs[key] = value
+            try:
+                ret = backend_fn(*native_args, **native_kwargs)
+            except Exception:
+                # let the full chain raise the appropriate ivy exception
+                return fn(*args, **kwargs)
+            if isinstance(ret, (ivy.NativeArray, np.ndarray)):
+                return ivy.Array(ret)
+            return ivy.to_ivy(ret, nested=True, include_derived={"tuple": True})
+
+        _fast_path.fast_path_fn = backend_fn
+        return _fast_path
+
+    return _handle_fast_path
+
+
 # Functions #
 
 
@@ -1112,13 +1231,15 @@ def _wrap_function(
                 )
         return to_wrap
     if isinstance(to_wrap, FunctionType):
+        backend_fn = to_wrap
+        fast_path = not compositional and _supports_fast_path(original, to_wrap)
         # set attributes
         for attr in original.__dict__.keys():
             # private attribute or decorator
             if (
                 attr.startswith("_")
                 or hasattr(ivy, attr)
-                or attr == "mixed_backend_wrappers"
+                or attr in ("mixed_backend_wrappers", "fast_path_fn")
             ):
                 continue
             setattr(to_wrap, attr, getattr(original, attr))
@@ -1161,6 +1282,12 @@ def _wrap_function(
                 if hasattr(to_wrap.compos, attr):
                     to_wrap.compos = to_wrap.compos.__wrapped__
             to_wrap.compos.__dict__["array_spec"] = array_spec
+        if fast_path:
+            array_like_positions = ()
+            if hasattr(original, "handle_array_like_without_promotion"):
+                array_like_positions = _array_like_positions(backend_fn)
+            if array_like_positions is not None:
+                to_wrap = handle_fast_path(backend_fn, array_like_positions)(to_wrap)
     return to_wrap
 
 
@@ -23,6 +23,9 @@ _compiled_backends_ids = {}
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = {}
+# wrapped backend functions, built once per backend (and version) and reused on
+# later calls to set_backend/previous_backend
+_wrapped_backend_cache = {}
 
 
 class ContextManager:
@@ -199,13 +202,57 @@ def current_backend(*args, **kwargs):
     return importlib.import_module(_backend_dict[implicit_backend])
 
 
+def _get_wrapped_backend_cache(backend_str, backend_version, target):
+    """
+    Return the cache of wrapped functions for the namespace `target` populated from
+    the backend `backend_str`, keyed by the backend name and version.
+    """
+    key = (backend_str, backend_version, target)
+    if key not in _wrapped_backend_cache:
+        _wrapped_backend_cache[key] = {}
+    return _wrapped_backend_cache[key]
+
+
+def _wrap_function_cached(cache, key, to_wrap, original, compositional=False):
+    """
+    Wrap `to_wrap` as `_wrap_function` does, reusing the wrapped function stored in
+    `cache` if it was built from the same backend function and original function.
+    """
+    if key != "linalg":
+        cached = cache.get(key)
+        if (
+            cached is not None
+            and (cached[1] is to_wrap or cached[2] is to_wrap)
+            and (cached[0] is original or cached[2] is original)
+        ):
+            return cached[2]
+    wrapped = _wrap_function(
+        key=key, to_wrap=to_wrap, original=original, compositional=compositional
+    )
+    cache[key] = (original, to_wrap, wrapped)
+    return wrapped
+
+
+def _get_backend_version(backend):
+    return getattr(backend, "backend_version", {}).get("version")
+
+
 def _set_module_backend(
-    original_dict, target, backend, invalid_dtypes=None, backend_str=None
+    original_dict,
+    target,
+    backend,
+    invalid_dtypes=None,
+    backend_str=None,
+    backend_version=None,
 ):
     invalid_dtypes = (
         backend.invalid_dtypes if invalid_dtypes is None else invalid_dtypes
     )
     backend_str = backend.current_backend_str() if backend_str is None else backend_str
+    backend_version = (
+        _get_backend_version(backend) if backend_version is None else backend_version
+    )
+    cache = _get_wrapped_backend_cache(backend_str, backend_version, target)
     for k, v in original_dict.items():
         compositional = k not in backend.__dict__
         if compositional:
@@ -213,8 +260,8 @@ def _set_module_backend(
                 del target.__dict__[k]
                 continue
             backend.__dict__[k] = v
-        target.__dict__[k] = _wrap_function(
-            key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
+        target.__dict__[k] = _wrap_function_cached(
+            cache, k, backend.__dict__[k], v, compositional=compositional
         )
         if (
             isinstance(v, types.ModuleType)
@@ -227,6 +274,7 @@ def _set_module_backend(
                 backend.__dict__[k],
                 invalid_dtypes=invalid_dtypes,
                 backend_str=backend_str,
+                backend_version=backend_version,
             )
 
 
@@ -533,11 +581,17 @@ def previous_backend():
         new_backend_dict = (
             backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
         )
+        if backend_stack:
+            cache = _get_wrapped_backend_cache(
+                backend_stack[-1].current_backend_str(),
+                _get_backend_version(backend_stack[-1]),
+                ivy,
+            )
         # wrap backend functions if there still is a backend, and add functions
         # to ivy namespace
         for k, v in new_backend_dict.items():
             if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
+                v = _wrap_function_cached(cache, k, v, ivy_original_dict[k])
             if k in ivy_original_dict:
                 ivy.__dict__[k] = v
             if k in ivy.functional.__dict__ and not k.startswith("__"):
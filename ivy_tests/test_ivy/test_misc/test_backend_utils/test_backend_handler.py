@@ -234,6 +234,26 @@ def test_set_backend(backend, array_type):
     )
 
 
+@pytest.mark.parametrize("backend", _available_frameworks())
+def test_set_backend_reuses_wrapped_functions(backend):
+    ivy.unset_backend()
+    ivy.set_backend(backend)
+    first_sum = ivy.sum
+    ivy.previous_backend()
+
+    # the wrapped namespace is built once and reused on later switches
+    ivy.set_backend(backend)
+    ivy.utils.assertions.check_equal(id(first_sum), id(ivy.sum), as_array=False)
+    ivy.set_backend("numpy")
+    ivy.previous_backend()
+    ivy.utils.assertions.check_equal(id(first_sum), id(ivy.sum), as_array=False)
+    x = ivy.array([1.0, 2.0, 3.0])
+    ivy.utils.assertions.check_equal(
+        ivy.to_numpy(ivy.sum(x)), np.array(6.0), as_array=False
+    )
+    ivy.unset_backend()
+
+
 @pytest.mark.parametrize("backend", ["torch", "numpy"])
 def test_set_backend_no_warning_when_inplace_update_supported(backend):
     with pytest.warns(None):
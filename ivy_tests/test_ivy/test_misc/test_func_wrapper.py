@@ -47,6 +47,11 @@ def _fn8(x):
     return ivy.ones_like(x)
 
 
+def _native_add(x, y):
+    assert not isinstance(x, ivy.Array) and not isinstance(y, ivy.Array)
+    return ivy.to_native(ivy.add(x, y))
+
+
 def _jl(x, *args, fn_original, **kwargs):
     return fn_original(x) * 3j
 
@@ -181,6 +186,48 @@ def test_to_native_arrays_and_back(backend_fw):
     ivy.previous_backend()
 
 
+def test_handle_fast_path(backend_fw):
+    ivy.set_backend(backend_fw)
+    full_chain_calls = []
+
+    def _full_chain(*args, **kwargs):
+        full_chain_calls.append(args)
+        return ivy.add.__wrapped__(*args, **kwargs)
+
+    fn = ivy.func_wrapper.handle_fast_path(_native_add)(_full_chain)
+    x = ivy.array([1.0, 2.0, 3.0])
+    # plain arrays and python scalars skip the decorator chain
+    ret = fn(x, 2.0)
+    assert isinstance(ret, ivy.Array)
+    assert np.allclose(ivy.to_numpy(ret), [3.0, 4.0, 5.0])
+    fn(x, ivy.native_array([1.0, 1.0, 1.0]))
+    assert not full_chain_calls
+    # containers and out arguments go through the full chain
+    ret = fn(ivy.Container(a=x), 1.0)
+    assert isinstance(ret, ivy.Container)
+    out = ivy.zeros((3,))
+    fn(x, x, out=out)
+    assert np.allclose(ivy.to_numpy(out), [2.0, 4.0, 6.0])
+    assert len(full_chain_calls) == 2
+    # backend errors are handled by the full chain
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        fn(x, ivy.array([1.0, 2.0]))
+    assert len(full_chain_calls) == 3
+    ivy.previous_backend()
+
+
+def test_wrapped_functions_use_fast_path(backend_fw):
+    ivy.set_backend(backend_fw)
+    assert hasattr(ivy.add, "fast_path_fn")
+    x = ivy.array([1.0, 2.0, 3.0])
+    y = ivy.native_array([1.0, 1.0, 1.0])
+    assert np.allclose(
+        ivy.to_numpy(ivy.add(x, y, alpha=2)),
+        ivy.to_numpy(ivy.add.__wrapped__(x, y, alpha=2)),
+    )
+    ivy.previous_backend()
+
+
 @pytest.mark.parametrize(
     "array_to_update",
     [0, 1, 2, 3, 4],
@@ -0,0 +1,56 @@
+"""
+Benchmark the latency of switching the global backend.
+
+The first switch to a backend wraps every backend function with the decorators in
+`ivy.func_wrapper.FN_DECORATORS`, later switches reuse the cached wrapped namespace.
+The uncached latency is measured by clearing that cache before every switch.
+
+Usage: python scripts/benchmarks/backend_switch.py --backends numpy torch
+"""
+
+import argparse
+import time
+
+import ivy
+from ivy.utils.backend import handler
+from utils import format_time, measure, print_table
+
+
+def _switch(backend):
+    ivy.set_backend(backend)
+    ivy.previous_backend()
+
+
+def _uncached_switch(backend):
+    handler._wrapped_backend_cache.clear()
+    _switch(backend)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = []
+    for backend in args.backends:
+        ivy.unset_backend()
+        start = time.perf_counter()
+        _switch(backend)
+        first = time.perf_counter() - start
+        uncached = measure(lambda: _uncached_switch(backend), number=args.number)
+        cached = measure(lambda: _switch(backend), number=args.number)
+        rows.append(
+            (
+                backend,
+                format_time(first),
+                format_time(uncached),
+                format_time(cached),
+                f"{uncached / cached:.1f}x",
+            )
+        )
+    print_table(("backend", "first", "uncached", "cached", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark the per-call overhead of ivy functions on small arrays.
+
+Functions whose decorators allow it dispatch plain array arguments straight to the
+backend implementation, the full decorator chain is still reachable through the
+`__wrapped__` attribute of the dispatcher. Both are timed against the native call.
+
+Usage: python scripts/benchmarks/op_overhead.py --backend numpy
+"""
+
+import argparse
+
+import ivy
+from utils import format_time, measure, print_table
+
+
+def _cases(x, y):
+    return {
+        "add": ((x, y), {}),
+        "multiply": ((x, y), {}),
+        "exp": ((x,), {}),
+        "abs": ((x,), {}),
+        "sum": ((x,), {"axis": 0}),
+        "mean": ((x,), {}),
+        "matmul": ((x, y), {}),
+        "argmax": ((x,), {}),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--size", type=int, default=4)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    ivy.set_backend(args.backend)
+    backend = ivy.current_backend()
+    x = ivy.random_uniform(shape=(args.size, args.size))
+    y = ivy.random_uniform(shape=(args.size, args.size))
+    rows = []
+    for name, (fn_args, fn_kwargs) in _cases(x, y).items():
+        fn = ivy.__dict__[name]
+        native_args = [ivy.to_native(a) for a in fn_args]
+        native_fn = getattr(fn, "fast_path_fn", backend.__dict__[name])
+        native = measure(lambda: native_fn(*native_args, **fn_kwargs), args.number)
+        fast = measure(lambda: fn(*fn_args, **fn_kwargs), args.number)
+        if hasattr(fn, "fast_path_fn"):
+            full = measure(lambda: fn.__wrapped__(*fn_args, **fn_kwargs), args.number)
+        else:
+            full = fast
+        rows.append(
+            (
+                name,
+                format_time(native),
+                format_time(full),
+                format_time(fast),
+                f"{full / fast:.1f}x",
+            )
+        )
+    print_table(("function", "backend", "full chain", "ivy", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Shared helpers for the micro-benchmarks in this directory."""
+
+import timeit
+
+
+def measure(fn, number=100, repeat=5):
+    """Return the best per-call time of `fn` in seconds."""
+    timer = timeit.Timer(fn)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def print_table(header, rows):
+    widths = [
+        max(len(str(cell)) for cell in column) for column in zip(header, *rows)
+    ]
+    line = "  ".join(f"{{:<{w}}}" for w in widths)
+    print(line.format(*header))
+    print(line.format(*("-" * w for w in widths)))
+    for row in rows:
+        print(line.format(*row))